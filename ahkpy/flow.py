@@ -59,6 +59,10 @@ def sleep(secs):
 
 
 def _wait_for(secs, check_fn):
+    # Poll instead of calling blocking AHK commands like KeyWait. The GIL is
+    # released during every AHK call, but a blocking call would still hold
+    # global_ahk_lock for the whole wait and stall the other threads that call
+    # AHK.
     if secs is None:
         secs = float("inf")
 
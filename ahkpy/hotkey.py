@@ -5,7 +5,7 @@ import functools
 from typing import Callable
 
 from . import hotkey_context
-from .flow import ahk_call, _wrap_callback
+from .flow import _wrap_callback
 
 __all__ = [
     "Hotkey",
@@ -131,18 +131,15 @@ class Hotkey:
 
     def enable(self):
         """Enable the hotkey."""
-        with self.context._manager():
-            ahk_call("HotkeySpecial", self.key_name, "On")
+        self.context._call("HotkeySpecial", self.key_name, "On")
 
     def disable(self):
         """Disable the hotkey."""
-        with self.context._manager():
-            ahk_call("HotkeySpecial", self.key_name, "Off")
+        self.context._call("HotkeySpecial", self.key_name, "Off")
 
     def toggle(self):
         """Enable the hotkey if it's disabled or do the opposite."""
-        with self.context._manager():
-            ahk_call("HotkeySpecial", self.key_name, "Toggle")
+        self.context._call("HotkeySpecial", self.key_name, "Toggle")
 
     def update(self, *, func=None, buffer=None, priority=None, max_threads=None, input_level=None):
         """Update the hotkey callback and options.
@@ -154,38 +151,40 @@ class Hotkey:
             if not callable(func):
                 raise TypeError(f"object {func!r} must be callable")
 
+            def hotkey_handler(func):
+                func(hotkey=self)
+
             func = _wrap_callback(
                 func,
                 ("hotkey",),
                 _bare_hotkey_handler,
-                functools.partial(_hotkey_handler, hotkey=self),
+                hotkey_handler,
             )
 
-        options = []
+        option_str = _hotkey_options(buffer, priority, max_threads, input_level)
+        self.context._call("Hotkey", self.key_name, func, option_str)
+
 
-        if buffer:
-            options.append("B")
-        elif buffer is not None:
-            options.append("B0")
+@functools.lru_cache(maxsize=256, typed=True)
+def _hotkey_options(buffer, priority, max_threads, input_level):
+    options = []
 
-        if priority is not None:
-            options.append(f"P{priority}")
+    if buffer:
+        options.append("B")
+    elif buffer is not None:
+        options.append("B0")
 
-        if max_threads is not None:
-            options.append(f"T{max_threads}")
+    if priority is not None:
+        options.append(f"P{priority}")
 
-        if input_level is not None:
-            options.append(f"I{input_level}")
+    if max_threads is not None:
+        options.append(f"T{max_threads}")
 
-        option_str = "".join(options)
+    if input_level is not None:
+        options.append(f"I{input_level}")
 
-        with self.context._manager():
-            ahk_call("Hotkey", self.key_name, func, option_str)
+    return "".join(options)
 
 
 def _bare_hotkey_handler(func):
     func()
-
-
-def _hotkey_handler(func, hotkey):
-    func(hotkey=hotkey)
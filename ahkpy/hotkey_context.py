@@ -1,12 +1,10 @@
-import dataclasses as dc
 import functools
-from contextlib import contextmanager
 from typing import Callable, Optional, Union
 
 from .hotkey import hotkey as _hotkey
 from .hotstring import hotstring as _hotstring
 from .remap_key import remap_key as _remap_key
-from .flow import ahk_call, global_ahk_lock, _wrap_callback
+from .flow import ahk_call, _wrap_callback
 
 __all__ = [
     "HotkeyContext",
@@ -17,7 +15,6 @@ __all__ = [
 ]
 
 
-@dc.dataclass(frozen=True)
 class HotkeyContext:
     """The hotkey, hotstring, and key remappings immutable factory.
 
@@ -46,24 +43,43 @@ class HotkeyContext:
        <https://www.autohotkey.com/docs/commands/Hotkey.htm#IfFn>`_
     """
 
-    active_when: Optional[Callable]
-    __slots__ = ("active_when",)
+    # A plain class instead of a frozen dataclass: the predicate must be wrapped
+    # in __init__, which a frozen dataclass only allows via
+    # object.__setattr__(). The read-only property keeps the context
+    # immutable.
+    __slots__ = ("_active_when", "_hash")
 
     # TODO: Consider adding context options: MaxThreadsBuffer,
     # MaxThreadsPerHotkey, and InputLevel.
 
     def __init__(self, active_when: Callable = None, *args):
-        if active_when is None:
-            object.__setattr__(self, "active_when", None)
-            return
-
-        active_when = _wrap_callback(
-            functools.partial(active_when, *args),
-            ("hotkey",),
-            _bare_predicate,
-            _predicate,
-        )
-        object.__setattr__(self, "active_when", active_when)
+        if active_when is not None:
+            if args:
+                active_when = functools.partial(active_when, *args)
+            active_when = _wrap_callback(
+                active_when,
+                ("hotkey",),
+                _bare_predicate,
+                _predicate,
+            )
+        self._active_when = active_when
+        # Hotkeys and hotstrings hash their context, so compute it only once.
+        self._hash = hash(active_when)
+
+    @property
+    def active_when(self) -> Optional[Callable]:
+        return self._active_when
+
+    def __repr__(self):
+        return f"{self.__class__.__qualname__}(active_when={self._active_when!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._active_when == other._active_when
+
+    def __hash__(self):
+        return self._hash
 
     # Copy arguments verbatim to make Pylance's suggestions work. Use
     # functools.wraps so that the API docs are generated.
@@ -130,8 +146,7 @@ class HotkeyContext:
             reset_recognizer=reset_recognizer,
         )
 
-    @contextmanager
-    def _manager(self):
+    def _call(self, cmd, *args):
         # I don't want to make HotkeyContext a Python context manager, because
         # the end users will be tempted to use it as such, e.g:
         #
@@ -151,21 +166,11 @@ class HotkeyContext:
         #
         #     ctx = hotkey_context(lambda: ...)
         #     ctx.hotkey(...)
-
-        with global_ahk_lock:
-            self._enter()
-            try:
-                yield
-            finally:
-                self._exit()
-
-    def _enter(self):
-        if self.active_when is not None:
-            ahk_call("HotkeyContext", self.active_when)
-
-    def _exit(self):
-        if self.active_when is not None:
-            ahk_call("HotkeyExitContext")
+        #
+        # Entering the context, calling the command, and exiting the context is
+        # done in a single AHK call, so no other thread can change the "Hotkey,
+        # If" criterion in between.
+        return ahk_call("CallInContext", self._active_when, cmd, *args)
 
 
 def _bare_predicate(func, *_):
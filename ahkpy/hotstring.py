@@ -224,23 +224,22 @@ class Hotstring:
     #     C1 <-- C --> C0
 
     def __post_init__(self):
-        if hasattr(self.trigger, "lower") and not self.case_sensitive:
+        if not isinstance(self.trigger, str):
+            raise TypeError(f"trigger must be a str, not {self.trigger.__class__.__name__}")
+        if not self.case_sensitive:
             object.__setattr__(self, "trigger", self.trigger.lower())
 
     def enable(self):
         """Enable the hotkey."""
-        with self.context._manager():
-            ahk_call("Hotstring", f":{self._id_options()}:{self.trigger}", "", "On")
+        self.context._call("Hotstring", f":{self._id_options()}:{self.trigger}", "", "On")
 
     def disable(self):
         """Disable the hotkey."""
-        with self.context._manager():
-            ahk_call("Hotstring", f":{self._id_options()}:{self.trigger}", "", "Off")
+        self.context._call("Hotstring", f":{self._id_options()}:{self.trigger}", "", "Off")
 
     def toggle(self):
         """Enable the hotstring if it's disabled or do the opposite."""
-        with self.context._manager():
-            ahk_call("Hotstring", f":{self._id_options()}:{self.trigger}", "", "Toggle")
+        self.context._call("Hotstring", f":{self._id_options()}:{self.trigger}", "", "Toggle")
 
     def _id_options(self):
         case_option = "C" if self.case_sensitive else ""
@@ -257,82 +256,97 @@ class Hotstring:
         :meth:`HotkeyContext.hotstring`.
         """
         if callable(repl):
+            def hotstring_handler(func):
+                func(hotstring=self)
+
             repl = _wrap_callback(
                 repl,
                 ("hotstring",),
                 _bare_hotstring_handler,
-                functools.partial(_hotstring_handler, hotstring=self),
+                hotstring_handler,
             )
 
-        options = []
+        option_str = _hotstring_options(
+            self.case_sensitive, self.replace_inside_word, conform_to_case, wait_for_end_char, omit_end_char,
+            backspacing, priority, text, mode, key_delay, reset_recognizer,
+        )
+
+        self.context._call("Hotstring", f":{option_str}:{self.trigger}", repl)
+
 
-        if self.case_sensitive:
-            options.append("C")
-        elif conform_to_case:
-            options.append("C0")
-        elif conform_to_case is not None:
-            options.append("C1")
+_SEND_MODE_OPTIONS = {
+    None: "",
+    "input": "SI",
+    "play": "SP",
+    "event": "SE",
+}
 
-        if self.replace_inside_word:
-            options.append("?")
-        else:
-            options.append("?0")
 
-        if wait_for_end_char is False:
-            options.append("*")
-        elif omit_end_char:
+# typed=True because the options treat False and 0 differently, e.g.
+# 'wait_for_end_char is False'.
+@functools.lru_cache(maxsize=256, typed=True)
+def _hotstring_options(
+    case_sensitive, replace_inside_word, conform_to_case, wait_for_end_char, omit_end_char, backspacing, priority,
+    text, mode, key_delay, reset_recognizer,
+):
+    options = []
+
+    if case_sensitive:
+        options.append("C")
+    elif conform_to_case:
+        options.append("C0")
+    elif conform_to_case is not None:
+        options.append("C1")
+
+    if replace_inside_word:
+        options.append("?")
+    else:
+        options.append("?0")
+
+    if wait_for_end_char is False:
+        options.append("*")
+    elif omit_end_char:
+        options.append("*0")
+        options.append("O")
+    else:
+        if wait_for_end_char:
             options.append("*0")
-            options.append("O")
-        else:
-            if wait_for_end_char:
-                options.append("*0")
-            if omit_end_char is False:
-                options.append("O0")
-
-        if backspacing:
-            options.append("B")
-        elif backspacing is not None:
-            options.append("B0")
-
-        if key_delay is not None:
-            if key_delay > 0:
-                key_delay = int(key_delay * 1000)
-            options.append(f"K{key_delay}")
-
-        if priority is not None:
-            options.append(f"P{priority}")
-
-        if text:
-            options.append("T")
-        elif text is not None:
-            options.append("T0")
-
-        if mode == "input":
-            options.append("SI")
-        elif mode == "play":
-            options.append("SP")
-        elif mode == "event":
-            options.append("SE")
-        elif mode is not None:
-            raise ValueError(f"{mode!r} is not a valid send mode")
-
-        if reset_recognizer:
-            options.append("Z")
-        elif reset_recognizer is not None:
-            options.append("Z0")
-
-        option_str = "".join(options)
-
-        with self.context._manager():
-            ahk_call("Hotstring", f":{option_str}:{self.trigger}", repl)
+        if omit_end_char is False:
+            options.append("O0")
 
+    if backspacing:
+        options.append("B")
+    elif backspacing is not None:
+        options.append("B0")
 
-def _bare_hotstring_handler(func):
-    func()
+    if key_delay is not None:
+        if key_delay > 0:
+            key_delay = int(key_delay * 1000)
+        options.append(f"K{key_delay}")
 
+    if priority is not None:
+        options.append(f"P{priority}")
 
-def _hotstring_handler(func, hotstring):
-    func(hotstring=hotstring)
+    if text:
+        options.append("T")
+    elif text is not None:
+        options.append("T0")
+
+    try:
+        options.append(_SEND_MODE_OPTIONS[mode])
+    except KeyError:
+        raise ValueError(f"{mode!r} is not a valid send mode") from None
+
+    if reset_recognizer:
+        options.append("Z")
+    elif reset_recognizer is not None:
+        options.append("Z0")
+
+    return "".join(options)
+
+
+def _bare_hotstring_handler(func):
+    func()
 
 
 def reset_hotstring():
@@ -1,14 +1,20 @@
 import dataclasses as dc
 
-from .hotkey import Hotkey
-from .key_state import is_key_pressed
-from .sending import send
+from .hotkey import Hotkey, _hotkey_options
+from .sending import _get_delays, _get_send_level, _get_send_mode
 
 __all__ = [
     "RemappedKey",
 ]
 
 
+_SEND_MODES = {
+    "input": "Input",
+    "event": "Event",
+    "play": "Play",
+}
+
+
 def remap_key(ctx, origin_key, destination_key, *, mode=None, level=None):
     """Remap *origin_key* to *destination_key*.
 
@@ -17,43 +23,66 @@ def remap_key(ctx, origin_key, destination_key, *, mode=None, level=None):
     For valid keys refer to `List of Keys
     <https://www.autohotkey.com/docs/KeyList.htm>`_.
 
-    The optional keyword-only *mode* and *level* arguments are passed to the
-    :func:`send` function that will send the *destination_key* when the user
-    presses the *origin_key*.
+    The optional keyword-only *mode* and *level* arguments set the send mode
+    and the send level that are used to send the *destination_key* when the
+    user presses the *origin_key*. For valid values refer to :func:`send`. The
+    keys are sent by AHK directly, without calling Python on every keypress.
+    Therefore, if *mode* or *level* are not given, they, as well as the key
+    and mouse delays, are taken from the current :class:`Settings` once, when
+    the key is remapped. Changing the settings afterwards doesn't affect the
+    existing remappings.
 
     For more information refer to `Remapping Keys
     <https://www.autohotkey.com/docs/misc/Remap.htm>`_.
     """
     mouse = destination_key.lower() in {"lbutton", "rbutton", "mbutton", "xbutton1", "xbutton2"}
     if mouse:
-        def origin_hotkey():
-            if not is_key_pressed(destination_key):
-                send("{Blind}{%s DownR}" % destination_key, mode=mode, level=level, mouse_delay=-1)
-
-        def origin_up_hotkey():
-            send("{Blind}{%s Up}" % destination_key, mode=mode, level=level, mouse_delay=-1)
+        key_delay, mouse_delay = None, -1
+        # Don't press the mouse button again if it's being held down.
+        skip_if_pressed = destination_key
+        down_keys = "{Blind}{%s DownR}" % destination_key
     else:
+        key_delay, mouse_delay = -1, None
+        skip_if_pressed = ""
         ctrl_to_alt = (
             origin_key.lower() in {"ctrl", "lctrl", "rctrl"} and
             destination_key.lower() in {"alt", "lalt", "ralt"}
         )
         if ctrl_to_alt:
-            def origin_hotkey():
-                send(
-                    "{Blind}{%s Up}{%s DownR}" % (origin_key, destination_key),
-                    mode=mode,
-                    level=level,
-                    key_delay=-1,
-                )
+            down_keys = "{Blind}{%s Up}{%s DownR}" % (origin_key, destination_key)
         else:
-            def origin_hotkey():
-                send("{Blind}{%s DownR}" % destination_key, mode=mode, level=level, key_delay=-1)
-
-        def origin_up_hotkey():
-            send("{Blind}{%s Up}" % destination_key, mode=mode, level=level, key_delay=-1)
-
-    origin_hotkey = ctx.hotkey(f"*{origin_key}", origin_hotkey)
-    origin_up_hotkey = ctx.hotkey(f"*{origin_key} Up", origin_up_hotkey)
+            down_keys = "{Blind}{%s DownR}" % destination_key
+    up_keys = "{Blind}{%s Up}" % destination_key
+
+    mode = _get_send_mode(mode, key_delay=key_delay, mouse_delay=mouse_delay)
+    try:
+        mode_str = _SEND_MODES[mode]
+    except KeyError:
+        raise ValueError(f"{mode!r} is not a valid send mode") from None
+    # SendPlay is not affected by SendLevel.
+    level = _get_send_level(level) if mode != "play" else ""
+    if mode == "input":
+        # Leave the delays as is, like send_input() does.
+        delays = ("", "", "")
+    else:
+        delays = _get_delays(key_delay=key_delay, mouse_delay=mouse_delay, play=mode == "play")
+
+    # Register both hotkeys in one call. Their handlers are AHK functions that
+    # send the keys without calling back into Python on every keypress.
+    origin_hotkey = Hotkey(f"*{origin_key}", ctx)
+    origin_up_hotkey = Hotkey(f"*{origin_key} Up", ctx)
+    ctx._call(
+        "RemapKey",
+        origin_hotkey.key_name,
+        origin_up_hotkey.key_name,
+        down_keys,
+        up_keys,
+        skip_if_pressed,
+        mode_str,
+        level,
+        *delays,
+        _hotkey_options(buffer=False, priority=0, max_threads=1, input_level=0),
+    )
     return RemappedKey(origin_hotkey, origin_up_hotkey)
 
 
@@ -1,4 +1,4 @@
-from .flow import ahk_call, global_ahk_lock
+from .flow import ahk_call
 from .settings import get_settings, optional_ms
 from .unset import UNSET
 
@@ -82,60 +82,62 @@ def _get_send_mode(mode=None, key_delay=None, key_duration=None, mouse_delay=Non
 
 def send_input(keys, *, level=None, **rest):
     """Send simulated keystrokes and mouse clicks using the Input mode."""
-    with global_ahk_lock:
-        _send_level(level)
-        ahk_call("SendInput", keys)
+    ahk_call("SendWithSettings", "Input", _get_send_level(level), "", "", "", keys)
 
 
 def send_event(keys, *, level=None, key_delay=None, key_duration=None, mouse_delay=None):
     """Send simulated keystrokes and mouse clicks using the Event mode."""
-    with global_ahk_lock:
-        _send_level(level)
-        _set_delay(key_delay, key_duration, mouse_delay)
-        ahk_call("SendEvent", keys)
+    level = _get_send_level(level)
+    delays = _get_delays(key_delay, key_duration, mouse_delay)
+    ahk_call("SendWithSettings", "Event", level, *delays, keys)
 
 
 def send_play(keys, *, key_delay=None, key_duration=None, mouse_delay=None, **rest):
     """Send simulated keystrokes and mouse clicks using the Play mode."""
-    with global_ahk_lock:
-        # SendPlay is not affected by SendLevel.
-        _set_delay(key_delay, key_duration, mouse_delay, play=True)
-        ahk_call("SendPlay", keys)
+    # SendPlay is not affected by SendLevel.
+    delays = _get_delays(key_delay, key_duration, mouse_delay, play=True)
+    ahk_call("SendWithSettings", "Play", "", *delays, keys)
 
 
-def _send_level(level):
+def _get_send_level(level):
     if level is None:
         level = get_settings().send_level
     elif not 0 <= level <= 100:
         raise ValueError("level must be between 0 and 100")
-    ahk_call("SendLevel", int(level))
+    return int(level)
 
 
-def _set_delay(key_delay=None, key_duration=None, mouse_delay=None, play=False):
+def _get_delays(key_delay=None, key_duration=None, mouse_delay=None, play=False):
+    # Return the key delay, key duration, and mouse delay in milliseconds. An
+    # empty string tells SendWithSettings to leave the AHK setting as is.
     settings = get_settings()
     if play:
-        if key_delay is not UNSET and key_duration is not UNSET:
-            ahk_call(
-                "SetKeyDelay",
-                optional_ms(key_delay if key_delay is not None else settings.key_delay_play),
-                optional_ms(key_duration if key_duration is not None else settings.key_duration_play),
-                "Play",
-            )
-        if mouse_delay is not UNSET:
-            ahk_call(
-                "SetMouseDelay",
-                optional_ms(mouse_delay if mouse_delay is not None else settings.mouse_delay_play),
-                "Play",
-            )
+        default_key_delay = settings.key_delay_play
+        default_key_duration = settings.key_duration_play
+        default_mouse_delay = settings.mouse_delay_play
+    else:
+        default_key_delay = settings.key_delay
+        default_key_duration = settings.key_duration
+        default_mouse_delay = settings.mouse_delay
+
+    if key_delay is UNSET or key_duration is UNSET:
+        key_delay_ms = key_duration_ms = ""
+    else:
+        key_delay_ms = optional_ms(key_delay if key_delay is not None else default_key_delay)
+        key_duration_ms = optional_ms(key_duration if key_duration is not None else default_key_duration)
+
+    if mouse_delay is UNSET:
+        mouse_delay_ms = ""
     else:
-        if key_delay is not UNSET and key_duration is not UNSET:
-            ahk_call(
-                "SetKeyDelay",
-                optional_ms(key_delay if key_delay is not None else settings.key_delay),
-                optional_ms(key_duration if key_duration is not None else settings.key_duration),
-            )
-        if mouse_delay is not UNSET:
-            ahk_call(
-                "SetMouseDelay",
-                optional_ms(mouse_delay if mouse_delay is not None else settings.mouse_delay),
-            )
+        mouse_delay_ms = optional_ms(mouse_delay if mouse_delay is not None else default_mouse_delay)
+
+    return key_delay_ms, key_duration_ms, mouse_delay_ms
+
+
+def _set_delay(key_delay=None, key_duration=None, mouse_delay=None, play=False):
+    key_delay_ms, key_duration_ms, mouse_delay_ms = _get_delays(key_delay, key_duration, mouse_delay, play)
+    play_str = "Play" if play else ""
+    if key_delay_ms != "":
+        ahk_call("SetKeyDelay", key_delay_ms, key_duration_ms, play_str)
+    if mouse_delay_ms != "":
+        ahk_call("SetMouseDelay", mouse_delay_ms, play_str)
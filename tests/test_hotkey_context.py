@@ -1,4 +1,6 @@
 
+import pytest
+
 import ahkpy as ahk
 
 
@@ -51,3 +53,18 @@ def test_only_hotkey_context(child_ahk, settings):
     assert boop_windows.wait(timeout=1)
 
     ahk.send("{F24}")
+
+
+def test_hotkey_context_value():
+    ctx = ahk.HotkeyContext()
+    assert ctx == ahk.default_context
+    assert hash(ctx) == hash(ahk.default_context)
+    assert repr(ctx) == "HotkeyContext(active_when=None)"
+    with pytest.raises(AttributeError):
+        ctx.active_when = lambda: True
+
+    pred_ctx = ahk.HotkeyContext(lambda: True)
+    assert pred_ctx != ctx
+    assert pred_ctx == pred_ctx
+    assert hash(pred_ctx) == hash(pred_ctx)
+    assert hash(pred_ctx) == hash(pred_ctx.active_when)
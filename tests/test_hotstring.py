@@ -259,3 +259,8 @@ class TestHotstring:
         )
 
         ahk.send("{F24}")
+
+
+def test_exceptions():
+    with pytest.raises(TypeError, match="trigger must be a str, not int"):
+        ahk.hotstring(517, "five-one-seven")
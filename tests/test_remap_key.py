@@ -1,3 +1,5 @@
+import pytest
+
 import ahkpy as ahk
 
 
@@ -37,3 +39,53 @@ def test_remap_key(request, child_ahk):
     assert win_f14.close_all(timeout=1)
 
     ahk.send("{F24}", level=10)
+
+
+def test_remap_key_modes(request, child_ahk):
+    def hotkeys():
+        import ahkpy as ahk
+        import sys
+        ahk.hotkey("F24", sys.exit)
+        ahk.hotkey("XButton1", lambda: ahk.message_box("XButton1 pressed"))
+        ahk.hotkey("!F14", lambda: ahk.message_box("Alt+F14 pressed"))
+        print("ok00")
+
+    child_ahk.popen_code(hotkeys)
+    child_ahk.wait(0)
+
+    # Destination is a mouse button. The button is not physically held down,
+    # so the remapping must send it.
+    remap_mouse = ahk.remap_key("F13", "XButton1")
+    request.addfinalizer(remap_mouse.disable)
+    ahk.send_event("{F13}", level=10)
+    win_xbutton = ahk.windows.filter(title="Python.ahk", text="XButton1 pressed")
+    assert win_xbutton.wait(timeout=1)
+    assert win_xbutton.close_all(timeout=1)
+    remap_mouse.disable()
+
+    # Ctrl to Alt releases Ctrl before pressing Alt.
+    remap_ctrl = ahk.remap_key("LCtrl", "LAlt")
+    request.addfinalizer(remap_ctrl.disable)
+    ahk.send_event("{LCtrl down}", level=10)
+    ahk.sleep(0.05)
+    ahk.send_event("{Blind}{F14}")
+    ahk.sleep(0.05)
+    ahk.send_event("{LCtrl up}", level=10)
+    win_alt_f14 = ahk.windows.filter(title="Python.ahk", text="Alt+F14 pressed")
+    assert win_alt_f14.wait(timeout=1)
+    assert win_alt_f14.close_all(timeout=1)
+    remap_ctrl.disable()
+
+    ahk.send("{F24}", level=10)
+
+
+def test_remap_key_level():
+    with pytest.raises(ValueError, match="level must be between 0 and 100"):
+        ahk.remap_key("F13", "F14", mode="event", level=1000)
+
+    # SendPlay is not affected by SendLevel, so the level is not checked.
+    remap_play = ahk.remap_key("F13", "F14", mode="play", level=1000)
+    remap_play.disable()
+
+    with pytest.raises(ValueError, match="'x' is not a valid send mode"):
+        ahk.remap_key("F13", "F14", mode="x")